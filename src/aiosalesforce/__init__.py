@@ -13,21 +13,61 @@ __all__ = [
     "ExceptionRule",
     "ResponseRule",
     "RetryPolicy",
+    "default_client",
     "format_soql",
 ]
 
-from .auth import ClientCredentialsFlow, JwtBearerFlow, SoapLogin
-from .client import Salesforce
-from .events import (
-    BulkApiBatchConsumptionEvent,
-    RequestEvent,
-    ResponseEvent,
-    RestApiCallConsumptionEvent,
-    RetryEvent,
-)
-from .retries import (
-    ExceptionRule,
-    ResponseRule,
-    RetryPolicy,
-)
-from .utils import format_soql
+import importlib
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .auth import ClientCredentialsFlow, JwtBearerFlow, SoapLogin
+    from .client import Salesforce
+    from .events import (
+        BulkApiBatchConsumptionEvent,
+        RequestEvent,
+        ResponseEvent,
+        RestApiCallConsumptionEvent,
+        RetryEvent,
+    )
+    from .http import default_client
+    from .retries import (
+        ExceptionRule,
+        ResponseRule,
+        RetryPolicy,
+    )
+    from .utils import format_soql
+
+# Names are imported lazily (PEP 562) on first access to keep the cost of
+# `import aiosalesforce` low for applications using only a subset of the package
+_SUBMODULE_BY_NAME = {
+    "ClientCredentialsFlow": "aiosalesforce.auth",
+    "JwtBearerFlow": "aiosalesforce.auth",
+    "SoapLogin": "aiosalesforce.auth",
+    "Salesforce": "aiosalesforce.client",
+    "BulkApiBatchConsumptionEvent": "aiosalesforce.events",
+    "RequestEvent": "aiosalesforce.events",
+    "ResponseEvent": "aiosalesforce.events",
+    "RestApiCallConsumptionEvent": "aiosalesforce.events",
+    "RetryEvent": "aiosalesforce.events",
+    "ExceptionRule": "aiosalesforce.retries",
+    "ResponseRule": "aiosalesforce.retries",
+    "RetryPolicy": "aiosalesforce.retries",
+    "default_client": "aiosalesforce.http",
+    "format_soql": "aiosalesforce.utils",
+}
+
+
+def __getattr__(name: str):
+    try:
+        submodule = _SUBMODULE_BY_NAME[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(submodule), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
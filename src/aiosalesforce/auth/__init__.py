@@ -5,7 +5,35 @@ __all__ = [
     "SoapLogin",
 ]
 
-from .base import Auth
-from .client_credentials_flow import ClientCredentialsFlow
-from .jwt_bearer_flow import JwtBearerFlow
-from .soap import SoapLogin
+import importlib
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base import Auth
+    from .client_credentials_flow import ClientCredentialsFlow
+    from .jwt_bearer_flow import JwtBearerFlow
+    from .soap import SoapLogin
+
+# Names are imported lazily (PEP 562) on first access so that using one
+# authentication flow doesn't pay the import cost of the others
+_SUBMODULE_BY_NAME = {
+    "Auth": "aiosalesforce.auth.base",
+    "ClientCredentialsFlow": "aiosalesforce.auth.client_credentials_flow",
+    "JwtBearerFlow": "aiosalesforce.auth.jwt_bearer_flow",
+    "SoapLogin": "aiosalesforce.auth.soap",
+}
+
+
+def __getattr__(name: str):
+    try:
+        submodule = _SUBMODULE_BY_NAME[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(submodule), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -1,14 +1,27 @@
 import asyncio
 import logging
+import time
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, final
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, final
+
+from aiosalesforce.exceptions import AuthenticationError
+from aiosalesforce.utils import json_loads
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    import httpx
+
     from aiosalesforce.client import Salesforce
 
+# Fraction of the token lifetime after which the token is considered stale
+# and refreshed proactively in the background
+STALE_THRESHOLD = 0.95
+
+# Seconds to wait after a failed background refresh before trying again
+REFRESH_RETRY_COOLDOWN = 30.0
+
 
 class Auth(ABC):
     """
@@ -16,9 +29,26 @@ class Auth(ABC):
 
     """
 
+    __slots__ = (
+        "_access_token",
+        "_inflight",
+        "_expiration_time",
+        "_stale_time",
+        "_background_refresh",
+        "_acquire_impl",
+        "_refresh_impl",
+    )
+
     def __init__(self) -> None:
-        self.__access_token: str | None = None
-        self.__lock = asyncio.Lock()
+        self._access_token: str | None = None
+        self._inflight: asyncio.Future[str] | None = None
+        self._expiration_time: float | None = None
+        self._stale_time: float | None = None
+        self._background_refresh: asyncio.Task[str] | None = None
+        # Bound once so that the hot call sites skip the MRO walk;
+        # subclasses must not reassign these methods after __init__
+        self._acquire_impl = self._acquire_new_access_token
+        self._refresh_impl = self._refresh_access_token
 
     @final
     async def get_access_token(self, client: "Salesforce") -> str:
@@ -39,22 +69,30 @@ class Auth(ABC):
             Access token
 
         """
-        async with self.__lock:
-            if self.__access_token is None:
+        # Fast path - return the cached token without any synchronization
+        token = self._access_token
+        if token is not None and not self.expired:
+            if self.stale:
+                self.__start_background_refresh(client)
+            return token
+        if self._inflight is not None:
+            # Another coroutine is already acquiring a token - wait for it
+            return await asyncio.shield(self._inflight)
+        if self._access_token is None:
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
                     "Acquiring new access token using %s for %s",
-                    self.__class__.__name__,
+                    type(self).__name__,
                     client.base_url,
                 )
-                self.__access_token = await self._acquire_new_access_token(client)
-            elif self.expired:
-                logger.debug(
-                    "Token expired, refreshing access token using %s for %s",
-                    self.__class__.__name__,
-                    client.base_url,
-                )
-                self.__access_token = await self._refresh_access_token(client)
-            return self.__access_token
+            return await self.__single_flight(self._acquire_impl, client)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Token expired, refreshing access token using %s for %s",
+                type(self).__name__,
+                client.base_url,
+            )
+        return await self.__single_flight(self._refresh_impl, client)
 
     @final
     async def refresh_access_token(self, client: "Salesforce") -> str:
@@ -72,18 +110,88 @@ class Auth(ABC):
             Access token
 
         """
-        if self.__access_token is None:
+        if self._access_token is None:
             raise RuntimeError("No access token to refresh")
-        token_before_refresh = self.__access_token
-        async with self.__lock:
-            if self.__access_token == token_before_refresh:
-                logger.debug(
-                    "Refreshing access token using %s for %s",
-                    self.__class__.__name__,
-                    client.base_url,
-                )
-                self.__access_token = await self._refresh_access_token(client)
-            return self.__access_token
+        if self._inflight is not None:
+            # Another coroutine is already refreshing the token - wait for it
+            return await asyncio.shield(self._inflight)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Refreshing access token using %s for %s",
+                type(self).__name__,
+                client.base_url,
+            )
+        return await self.__single_flight(self._refresh_impl, client)
+
+    def __start_background_refresh(self, client: "Salesforce") -> None:
+        """
+        Refresh a stale (but not yet expired) token in the background.
+
+        Callers keep using the current token while the refresh is in
+        progress, so nobody waits for the token endpoint round trip.
+
+        """
+        if self._inflight is not None or self._background_refresh is not None:
+            return
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Token is stale, refreshing access token in the background "
+                "using %s for %s",
+                type(self).__name__,
+                client.base_url,
+            )
+        task = asyncio.get_running_loop().create_task(
+            self.__single_flight(self._refresh_impl, client)
+        )
+        task.add_done_callback(self.__on_background_refresh_done)
+        self._background_refresh = task
+
+    def __on_background_refresh_done(self, task: "asyncio.Task[str]") -> None:
+        self._background_refresh = None
+        if not task.cancelled() and task.exception() is not None:
+            # Failure is not fatal - the current token remains usable until it
+            # expires, at which point acquisition is retried on the blocking path.
+            # Back off before the next attempt so a failing token endpoint is
+            # not hammered at request rate for the rest of the stale window
+            self._stale_time = time.monotonic() + REFRESH_RETRY_COOLDOWN
+            logger.warning(
+                "Background access token refresh failed",
+                exc_info=task.exception(),
+            )
+
+    async def __single_flight(
+        self,
+        acquire: "Callable[[Salesforce], Coroutine[Any, Any, str]]",
+        client: "Salesforce",
+    ) -> str:
+        """
+        Acquire a token exactly once, sharing the result with concurrent callers.
+
+        Concurrent callers await the in-flight future and wake up together
+        when the token (or the failure) is available.
+
+        """
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._inflight = future
+        try:
+            token = await acquire(client)
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark the exception as retrieved in case nobody is waiting
+            future.exception()
+            raise
+        else:
+            self._access_token = token
+            expiration_time = self._expiration_time
+            if expiration_time is not None:
+                lifetime = expiration_time - time.monotonic()
+                self._stale_time = expiration_time - (1 - STALE_THRESHOLD) * lifetime
+            else:
+                self._stale_time = None
+            future.set_result(token)
+            return token
+        finally:
+            self._inflight = None
 
     @abstractmethod
     async def _acquire_new_access_token(self, client: "Salesforce") -> str:
@@ -123,11 +231,60 @@ class Auth(ABC):
         """
         return await self._acquire_new_access_token(client)
 
+    @property
+    def stale(self) -> bool:
+        """True if the access token is close to expiring."""
+        stale_time = self._stale_time
+        return stale_time is not None and stale_time <= time.monotonic()
+
     @property
     def expired(self) -> bool:
         """True if the access token is expired."""
-        if self.__access_token is None:  # pragma: no cover
-            raise RuntimeError("Cannot check expiration of a non-existent access token")
-        # By default, assumes the access token never expires
+        # Unless the flow sets _expiration_time when acquiring a token,
+        # the access token is assumed to never expire
         # Salesforce client automatically refreshes the token after 401 response
-        return False
+        expiration_time = self._expiration_time
+        return expiration_time is not None and expiration_time <= time.monotonic()
+
+
+def parse_token_response(response: "httpx.Response") -> dict[str, Any]:
+    """
+    Parse an OAuth token endpoint response.
+
+    Shared by the OAuth-based flows - the response body is parsed exactly
+    once and reused for both the access token and error extraction.
+
+    Parameters
+    ----------
+    response : httpx.Response
+        Token endpoint response.
+
+    Returns
+    -------
+    dict[str, Any]
+        Parsed response body.
+
+    Raises
+    ------
+    AuthenticationError
+        If the token request was not successful.
+
+    """
+    try:
+        response_json = json_loads(response.content)
+    except Exception:  # pragma: no cover
+        response_json = None
+    if response.is_success and response_json is not None:
+        return response_json
+    if response_json is None:  # pragma: no cover
+        error_code = None
+        error_message = response.text
+    else:
+        error_code = response_json.get("error")
+        error_message = response_json.get("error_description", response.text)
+    raise AuthenticationError(
+        f"[{error_code}] {error_message}" if error_code else error_message,
+        response=response,
+        error_code=error_code,
+        error_message=error_message,
+    )
@@ -1,18 +1,38 @@
+import hashlib
+import math
 import time
 
 from typing import TYPE_CHECKING
+from urllib.parse import urlencode
 
-from aiosalesforce.auth.base import Auth
+import httpx
+
+from aiosalesforce.auth.base import Auth, parse_token_response
 from aiosalesforce.events import (
     RequestEvent,
     ResponseEvent,
 )
-from aiosalesforce.exceptions import AuthenticationError
-from aiosalesforce.utils import json_loads
 
 if TYPE_CHECKING:
     from aiosalesforce.client import Salesforce
 
+# Normalized once so httpx doesn't re-encode the header dict per request
+TOKEN_REQUEST_HEADERS = httpx.Headers(
+    {
+        "Content-Type": "application/x-www-form-urlencoded",
+        "Accept": "application/json",
+    }
+)
+
+# Process-wide cache of access tokens shared by flows constructed with
+# share_cache=True, keyed by a digest of the credentials and org URL
+# so secrets are not held in memory as plain-text dict keys
+_SHARED_TOKENS: dict[str, tuple[str, float]] = {}
+
+# Cached tokens are considered expired this many seconds early so a token
+# borrowed from the cache is never handed out moments before it dies
+_SHARED_TOKEN_MARGIN = 60.0
+
 
 class ClientCredentialsFlow(Auth):
     """
@@ -29,35 +49,75 @@ class ClientCredentialsFlow(Auth):
     timeout : float, optional
         Timeout for the access token in seconds.
         By default assumed to never expire.
+    share_cache : bool, optional
+        Share access tokens with other ClientCredentialsFlow instances in this
+        process which use the same credentials and Salesforce org, collapsing
+        their token refreshes into one. By default False.
 
     """
 
+    __slots__ = (
+        "client_id",
+        "client_secret",
+        "timeout",
+        "share_cache",
+        "_token_request_body",
+    )
+
     def __init__(
         self,
         client_id: str,
         client_secret: str,
         timeout: float | None = None,
+        share_cache: bool = False,
     ) -> None:
         super().__init__()
         self.client_id = client_id
         self.client_secret = client_secret
         self.timeout = timeout
+        self.share_cache = share_cache
+
+        # Credentials never change for an instance - encode the form body once
+        # instead of paying for urlencoding on every token acquisition
+        self._token_request_body = urlencode(
+            {
+                "grant_type": "client_credentials",
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+            }
+        ).encode("utf-8")
 
-        self._expiration_time: float | None = None
+    def _shared_cache_key(self, client: "Salesforce") -> str:
+        return hashlib.sha256(
+            f"{self.client_id}:{self.client_secret}:{client.base_url}".encode("utf-8")
+        ).hexdigest()
 
     async def _acquire_new_access_token(self, client: "Salesforce") -> str:
+        if self.share_cache:
+            cached = _SHARED_TOKENS.get(self._shared_cache_key(client))
+            if cached is not None:
+                token, expiration_time = cached
+                if expiration_time > time.monotonic():
+                    self._expiration_time = (
+                        expiration_time if math.isfinite(expiration_time) else None
+                    )
+                    return token
+        return await self._request_access_token(client)
+
+    async def _refresh_access_token(self, client: "Salesforce") -> str:
+        # A refresh means the current token was rejected; a cached token for
+        # the same credentials is just as stale, so evict it and go to the
+        # server instead of handing the rejected token right back
+        if self.share_cache:
+            _SHARED_TOKENS.pop(self._shared_cache_key(client), None)
+        return await self._request_access_token(client)
+
+    async def _request_access_token(self, client: "Salesforce") -> str:
         request = client.httpx_client.build_request(
             "POST",
             f"{client.base_url}/services/oauth2/token",
-            headers={
-                "Content-Type": "application/x-www-form-urlencoded",
-                "Accept": "application/json",
-            },
-            data={
-                "grant_type": "client_credentials",
-                "client_id": self.client_id,
-                "client_secret": self.client_secret,
-            },
+            headers=TOKEN_REQUEST_HEADERS,
+            content=self._token_request_body,
         )
         await client.event_bus.publish_event(
             RequestEvent(
@@ -72,20 +132,7 @@ class ClientCredentialsFlow(Auth):
             semaphore=client._semaphore,
             request=request,
         )
-        if not response.is_success:
-            try:
-                response_json = json_loads(response.content)
-                error_code = response_json["error"]
-                error_message = response_json["error_description"]
-            except Exception:  # pragma: no cover
-                error_code = None
-                error_message = response.text
-            raise AuthenticationError(
-                f"[{error_code}] {error_message}" if error_code else error_message,
-                response=response,
-                error_code=error_code,
-                error_message=error_message,
-            )
+        response_json = parse_token_response(response)
         await client.event_bus.publish_event(
             ResponseEvent(
                 type="response",
@@ -93,12 +140,16 @@ class ClientCredentialsFlow(Auth):
             )
         )
         if self.timeout is not None:
-            self._expiration_time = time.time() + self.timeout
-        return json_loads(response.content)["access_token"]
-
-    @property
-    def expired(self) -> bool:
-        super().expired
-        if self._expiration_time is None:  # pragma: no cover
-            return False
-        return self._expiration_time <= time.time()
+            self._expiration_time = time.monotonic() + self.timeout
+        else:
+            # Reset any finite expiration inherited from the shared cache
+            self._expiration_time = None
+        token: str = response_json["access_token"]
+        if self.share_cache:
+            _SHARED_TOKENS[self._shared_cache_key(client)] = (
+                token,
+                self._expiration_time - _SHARED_TOKEN_MARGIN
+                if self._expiration_time is not None
+                else math.inf,
+            )
+        return token
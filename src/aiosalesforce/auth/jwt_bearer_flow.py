@@ -11,10 +11,8 @@ except ImportError:  # pragma: no cover
     jwt = None  # type: ignore
     serialization = None  # type: ignore
 
-from aiosalesforce.auth.base import Auth
+from aiosalesforce.auth.base import Auth, parse_token_response
 from aiosalesforce.events import RequestEvent, ResponseEvent
-from aiosalesforce.exceptions import AuthenticationError
-from aiosalesforce.utils import json_loads
 
 if TYPE_CHECKING:
     from aiosalesforce.client import Salesforce
@@ -43,6 +41,16 @@ class JwtBearerFlow(Auth):
 
     """
 
+    __slots__ = (
+        "client_id",
+        "username",
+        "private_key_file",
+        "private_key_passphrase",
+        "timeout",
+        "_private_key",
+        "_audience",
+    )
+
     def __init__(
         self,
         client_id: str,
@@ -58,32 +66,39 @@ class JwtBearerFlow(Auth):
         self.private_key_passphrase = private_key_passphrase
         self.timeout = timeout
 
-        self._expiration_time: float | None = None
+        self._audience: str | None = None
 
         if jwt is None or serialization is None:  # pragma: no cover
             raise ImportError("Install aiosalesforce[jwt] to use the JwtBearerFlow.")
 
-    async def _acquire_new_access_token(self, client: "Salesforce") -> str:
-        payload = {
-            "iss": self.client_id,
-            "aud": "https://test.salesforce.com"
-            if client.base_url.endswith(".sandbox.my.salesforce.com")
-            else "https://login.salesforce.com",
-            "sub": self.username,
-            "exp": int(time.time()) + 300,
-        }
+        # The key is immutable - read and parse the PEM file once instead of
+        # paying for a file read and an RSA parse on every token refresh
         with open(self.private_key_file, "rb") as file:
-            private_key = serialization.load_pem_private_key(
+            self._private_key = serialization.load_pem_private_key(
                 data=file.read(),
                 password=self.private_key_passphrase.encode("utf-8")
                 if self.private_key_passphrase is not None
                 else None,
             )
+
+    async def _acquire_new_access_token(self, client: "Salesforce") -> str:
+        audience = self._audience
+        if audience is None:
+            audience = self._audience = (
+                "https://test.salesforce.com"
+                if client.base_url.endswith(".sandbox.my.salesforce.com")
+                else "https://login.salesforce.com"
+            )
+        payload = {
+            "iss": self.client_id,
+            "aud": audience,
+            "sub": self.username,
+            "exp": int(time.time()) + 300,
+        }
         assertion = jwt.encode(
             payload,
-            private_key,  # type: ignore
+            self._private_key,  # type: ignore
             algorithm="RS256",
-            headers={"alg": "RS256"},
         )
         request = client.httpx_client.build_request(
             "POST",
@@ -110,20 +125,7 @@ class JwtBearerFlow(Auth):
             semaphore=client._semaphore,
             request=request,
         )
-        if not response.is_success:
-            try:
-                response_json = json_loads(response.content)
-                error_code = response_json["error"]
-                error_message = response_json["error_description"]
-            except Exception:  # pragma: no cover
-                error_code = None
-                error_message = response.text
-            raise AuthenticationError(
-                f"[{error_code}] {error_message}" if error_code else error_message,
-                response=response,
-                error_code=error_code,
-                error_message=error_message,
-            )
+        response_json = parse_token_response(response)
         await client.event_bus.publish_event(
             ResponseEvent(
                 type="response",
@@ -131,12 +133,5 @@ class JwtBearerFlow(Auth):
             )
         )
         if self.timeout is not None:
-            self._expiration_time = time.time() + self.timeout
-        return json_loads(response.content)["access_token"]
-
-    @property
-    def expired(self) -> bool:
-        super().expired
-        if self._expiration_time is None:  # pragma: no cover
-            return False
-        return self._expiration_time <= time.time()
+            self._expiration_time = time.monotonic() + self.timeout
+        return response_json["access_token"]
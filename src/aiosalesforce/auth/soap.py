@@ -1,8 +1,9 @@
-import re
 import textwrap
 import time
 
 from typing import TYPE_CHECKING
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
 
 from aiosalesforce.events import (
     RequestEvent,
@@ -15,6 +16,55 @@ from .base import Auth
 if TYPE_CHECKING:
     from aiosalesforce.client import Salesforce
 
+# Elements extracted from the login response, by local (namespace-free) name
+LOGIN_RESPONSE_ELEMENTS = frozenset(
+    {
+        "sessionId",
+        "sessionSecondsValid",
+        "exceptionCode",
+        "exceptionMessage",
+    }
+)
+
+
+def _parse_login_response(content: bytes) -> dict[str, str]:
+    """
+    Extract elements of interest from the SOAP login response in a single pass.
+
+    Returns an empty dict if the response is not valid XML.
+
+    """
+    try:
+        # The response comes from Salesforce, not from untrusted input
+        root = ElementTree.fromstring(content)  # noqa: S314
+    except ElementTree.ParseError:
+        return {}
+    elements: dict[str, str] = {}
+    for element in root.iter():
+        # Strip the namespace, e.g., '{urn:partner.soap.sforce.com}sessionId'
+        tag = element.tag.rpartition("}")[2]
+        if tag in LOGIN_RESPONSE_ELEMENTS and element.text is not None:
+            elements.setdefault(tag, element.text)
+    return elements
+
+
+# Dedented once at import time - only the credentials vary per login
+SOAP_LOGIN_ENVELOPE = textwrap.dedent(
+    """\
+    <?xml version="1.0" encoding="utf-8" ?>
+    <env:Envelope
+        xmlns:xsd="http://www.w3.org/2001/XMLSchema"
+        xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+        xmlns:env="http://schemas.xmlsoap.org/soap/envelope/">
+        <env:Body>
+            <n1:login xmlns:n1="urn:partner.soap.sforce.com">
+                <n1:username>{username}</n1:username>
+                <n1:password>{password}</n1:password>
+            </n1:login>
+        </env:Body>
+    </env:Envelope>"""
+)
+
 
 class SoapLogin(Auth):
     """
@@ -33,6 +83,8 @@ class SoapLogin(Auth):
 
     """
 
+    __slots__ = ("username", "password", "security_token")
+
     def __init__(
         self,
         username: str,
@@ -44,27 +96,15 @@ class SoapLogin(Auth):
         self.password = password
         self.security_token = security_token
 
-        self._expiration_time: float | None = None
-
     async def _acquire_new_access_token(self, client: "Salesforce") -> str:
-        soap_xml_payload = f"""
-        <?xml version="1.0" encoding="utf-8" ?>
-        <env:Envelope
-            xmlns:xsd="http://www.w3.org/2001/XMLSchema"
-            xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
-            xmlns:env="http://schemas.xmlsoap.org/soap/envelope/">
-            <env:Body>
-                <n1:login xmlns:n1="urn:partner.soap.sforce.com">
-                    <n1:username>{self.username}</n1:username>
-                    <n1:password>{self.password}{self.security_token}</n1:password>
-                </n1:login>
-            </env:Body>
-        </env:Envelope>
-        """
+        soap_xml_payload = SOAP_LOGIN_ENVELOPE.format(
+            username=escape(self.username),
+            password=escape(f"{self.password}{self.security_token}"),
+        )
         request = client.httpx_client.build_request(
             "POST",
             f"{client.base_url}/services/Soap/u/{client.version}",
-            content=textwrap.dedent(soap_xml_payload).strip(),
+            content=soap_xml_payload,
             headers={
                 "Content-Type": "text/xml; charset=UTF-8",
                 "SOAPAction": "login",
@@ -84,26 +124,10 @@ class SoapLogin(Auth):
             semaphore=client._semaphore,
             request=request,
         )
-        response_text = response.text
+        elements = _parse_login_response(response.content)
         if not response.is_success:
-            try:
-                exception_code = str(
-                    re.search(
-                        r"<sf:exceptionCode>(.+)<\/sf:exceptionCode>",
-                        response_text,
-                    ).groups()[0]  # type: ignore
-                )
-            except AttributeError:  # pragma: no cover
-                exception_code = None
-            try:
-                exception_message = str(
-                    re.search(
-                        r"<sf:exceptionMessage>(.+)<\/sf:exceptionMessage>",
-                        response_text,
-                    ).groups()[0]  # type: ignore
-                )
-            except AttributeError:  # pragma: no cover
-                exception_message = response_text
+            exception_code = elements.get("exceptionCode")
+            exception_message = elements.get("exceptionMessage", response.text)
             raise AuthenticationError(
                 message=(
                     f"[{exception_code}] {exception_message}"
@@ -114,25 +138,21 @@ class SoapLogin(Auth):
                 error_code=exception_code,
                 error_message=exception_message,
             )
-        match_ = re.search(r"<sessionId>(.+)<\/sessionId>", response_text)
-        if match_ is None:  # pragma: no cover
+        session_id = elements.get("sessionId")
+        if session_id is None:  # pragma: no cover
             raise AuthenticationError(
-                f"Failed to parse sessionId from the SOAP response: {response_text}",
+                f"Failed to parse sessionId from the SOAP response: {response.text}",
                 response,
             )
-        session_id = match_.groups()[0]
 
         # Parse expiration time
-        match_ = re.search(
-            r"<sessionSecondsValid>(.+)<\/sessionSecondsValid>",
-            response_text,
-        )
         self._expiration_time = None
-        if match_ is not None:
-            try:
-                self._expiration_time = time.time() + int(match_.groups()[0])
-            except ValueError:  # pragma: no cover
-                pass
+        try:
+            self._expiration_time = time.monotonic() + int(
+                elements["sessionSecondsValid"]
+            )
+        except (KeyError, ValueError):  # pragma: no cover
+            pass
 
         await client.event_bus.publish_event(
             ResponseEvent(
@@ -141,10 +161,3 @@ class SoapLogin(Auth):
             )
         )
         return session_id
-
-    @property
-    def expired(self) -> bool:
-        super().expired
-        if self._expiration_time is None:  # pragma: no cover
-            return False
-        return self._expiration_time <= time.time()
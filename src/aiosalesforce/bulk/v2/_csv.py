@@ -1,105 +1,170 @@
 import csv
 import datetime
-import inspect
-import itertools
+import io
 import warnings
 
-from typing import Any, Collection, Iterable
+from functools import lru_cache
+from typing import Any, Callable, Collection, Iterable
 
 
 class CsvBuffer:
     """Utility class for buffering CSV data."""
 
-    __content: list[bytes]
-    __size: int
+    __slots__ = ("_buffer", "_n_rows", "_last_row_start")
 
     def __init__(self) -> None:
-        self.__content = []
-        self.__size = 0
+        self._buffer = bytearray()
+        self._n_rows = 0
+        self._last_row_start = 0
 
     def write(self, row: str) -> None:
         """Write a row to the buffer."""
-        encoded_row = row.encode("utf-8")
-        self.__content.append(encoded_row)
-        self.__size += len(encoded_row)
+        self._last_row_start = len(self._buffer)
+        self._buffer += row.encode("utf-8")
+        self._n_rows += 1
+
+    def write_bytes(self, row: bytes) -> None:
+        """Write an already encoded row to the buffer."""
+        self._last_row_start = len(self._buffer)
+        self._buffer += row
+        self._n_rows += 1
 
     def pop(self) -> bytes:
-        """Remove and return the last row from the buffer."""
-        row = self.__content.pop()
-        self.__size -= len(row)
+        """Remove and return the last written row from the buffer."""
+        row = bytes(self._buffer[self._last_row_start :])
+        del self._buffer[self._last_row_start :]
+        self._n_rows -= 1
         return row
 
     def flush(self) -> None:
         """Clear the buffer."""
-        self.__content = []
-        self.__size = 0
+        self._buffer.clear()
+        self._n_rows = 0
+        self._last_row_start = 0
 
     @property
     def n_rows(self) -> int:
         """Number of rows in the buffer (including the header)."""
-        return len(self.__content)
+        return self._n_rows
 
     @property
     def size(self) -> int:
         """Size of the buffer in bytes."""
-        return self.__size
+        return len(self._buffer)
 
     @property
     def content(self) -> bytes:
         """Contents of the buffer as a single byte string."""
-        return b"".join(self.__content)
+        return bytes(self._buffer)
+
+
+# Characters which require a CSV field to be quoted
+_SPECIAL_CHARACTERS = frozenset(',"\n\r')
+
+
+def _format_field(value: str) -> str:
+    """Quote a CSV field if it contains special characters."""
+    if _SPECIAL_CHARACTERS.isdisjoint(value):
+        return value
+    return '"' + value.replace('"', '""') + '"'
+
+
+# Serializers for exact value types; subclasses fall back to _serialize_value
+_SERIALIZERS: dict[type, Callable[[Any], str]] = {
+    bool: lambda value: "true" if value else "false",
+    type(None): lambda _: "",
+    str: str,
+    int: str,
+    float: str,
+    # yyyy-MM-ddTHH:mm:ss.SSS+/-HH:mm
+    datetime.datetime: lambda value: value.isoformat(timespec="milliseconds"),
+    datetime.date: lambda value: value.strftime(r"%Y-%m-%d"),
+}
 
 
 def _serialize_value(value: Any) -> str:
     """Serialize a CSV scalar value."""
+    serializer = _SERIALIZERS.get(type(value))
+    if serializer is not None:
+        return serializer(value)
+    # Structural matching handles subclasses of the supported types
     match value:
         case True:
-            return "true"
+            result = "true"
         case False:
-            return "false"
+            result = "false"
         case None:
-            return ""
+            result = ""
         case datetime.datetime():
             # yyyy-MM-ddTHH:mm:ss.SSS+/-HH:mm
-            return value.isoformat(timespec="milliseconds")
+            result = value.isoformat(timespec="milliseconds")
         case datetime.date():
-            return value.strftime(r"%Y-%m-%d")
+            result = value.strftime(r"%Y-%m-%d")
         case str() | int() | float():
-            return str(value)
+            result = str(value)
         case _:
             raise TypeError(f"Invalid value type '{type(value).__name__}'")
+    return result
+
+
+# typed=True keys the cache by (type, value) - without it equal values of
+# different types (True == 1 == 1.0) would share a single cached string
+_serialize_value_cached = lru_cache(maxsize=4096, typed=True)(_serialize_value)
+
+
+def _serialize_scalar(value: Any) -> str:
+    """Serialize a scalar value, memoizing repeated (low-cardinality) values."""
+    try:
+        return _serialize_value_cached(value)
+    except TypeError:
+        # Unhashable values cannot be cached; the uncached path also raises
+        # the proper error for unsupported types
+        return _serialize_value(value)
+
+
+def _serialize_item(key: str, value: Any) -> tuple[str, str]:
+    """Serialize a single CSV cell, resolving relationship dictionaries."""
+    if isinstance(value, dict):
+        if len(value) != 1:
+            raise ValueError(
+                f"Dict for '{key}' must have exactly one value, got {len(value)}"
+            )
+        _key, _value = next(iter(value.items()))
+        if key.lower().endswith("__c"):
+            warnings.warn(
+                (
+                    f"Relationships for custom fields must end with '__r'. "
+                    f"'{key}' was corrected to '{key[:-1]}r'."
+                ),
+                UserWarning,
+            )
+            new_key = f"{key[:-1]}r.{_key}"
+        else:
+            new_key = f"{key}.{_key}"
+        try:
+            return new_key, _serialize_scalar(_value)
+        except TypeError as exc:
+            raise TypeError(f"Invalid dict value for '{key}'") from exc
+    return key, _serialize_scalar(value)
 
 
 def _serialize_dict(data: dict[str, Any]) -> dict[str, str]:
     """Serialize a CSV row dictionary."""
-    new_dict = {}
+    return dict(_serialize_item(key, value) for key, value in data.items())
+
+
+def _serialize_row(data: dict[str, Any], field_indices: dict[str, int]) -> list[str]:
+    """Serialize a record into a list of fields in CSV column order."""
+    row = [""] * len(field_indices)
     for key, value in data.items():
-        new_key = key
-        if isinstance(value, dict):
-            if len(value) != 1:
-                raise ValueError(
-                    f"Dict for '{key}' must have exactly one value, got {len(value)}"
-                )
-            _key, _value = next(iter(value.items()))
-            if key.lower().endswith("__c"):
-                warnings.warn(
-                    (
-                        f"Relationships for custom fields must end with '__r'. "
-                        f"'{key}' was corrected to '{key[:-1]}r'."
-                    ),
-                    UserWarning,
-                )
-                new_key = f"{key[:-1]}r.{_key}"
-            else:
-                new_key = f"{key}.{_key}"
-            try:
-                new_value = _serialize_value(_value)
-            except TypeError as exc:
-                raise TypeError(f"Invalid dict value for '{key}'") from exc
-        else:
-            new_value = _serialize_value(value)
-        new_dict[new_key] = new_value
-    return new_dict
+        new_key, new_value = _serialize_item(key, value)
+        try:
+            row[field_indices[new_key]] = new_value
+        except KeyError:
+            raise ValueError(
+                f"dict contains fields not in fieldnames: {new_key!r}"
+            ) from None
+    return row
 
 
 def serialize_ingest_data(
@@ -141,36 +206,43 @@ def serialize_ingest_data(
         CSV file as a byte string.
 
     """
-    if fieldnames is None and inspect.isgenerator(data):
+    if fieldnames is None and not hasattr(data, "__len__"):
         warnings.warn(
             (
-                "Passing a generator without providing fieldnames causes the "
-                "entire contents of the generator to be stored in memory "
+                "Passing a generator or other one-shot iterable without "
+                "providing fieldnames causes its entire contents to be stored "
+                "in memory "
                 "to infer fieldnames. This may result in high memory usage."
             ),
             UserWarning,
         )
 
-    data = map(_serialize_dict, data)
+    rows: Iterable[list[str]]
     if fieldnames is None:
-        data = list(data)
-        fieldnames = dict.fromkeys(itertools.chain.from_iterable(data)).keys()
+        # Serialize and infer field names in a single pass over the data
+        serialized: list[dict[str, str]] = []
+        inferred_fieldnames: dict[str, None] = {}
+        for record in map(_serialize_dict, data):
+            serialized.append(record)
+            inferred_fieldnames.update(dict.fromkeys(record))
+        fieldnames = list(inferred_fieldnames)
+        rows = ([record.get(name, "") for name in fieldnames] for record in serialized)
+    else:
+        fieldnames = list(fieldnames)
+        field_indices = {name: index for index, name in enumerate(fieldnames)}
+        rows = (_serialize_row(record, field_indices) for record in data)
 
-    buffer = CsvBuffer()
-    writer = csv.DictWriter(
-        buffer,
-        fieldnames=fieldnames,
-        lineterminator="\n",
-    )
+    header = ",".join(map(_format_field, fieldnames)) + "\n"
 
+    buffer = CsvBuffer()
     carry_over: bytes | None = None
-    for row in data:
+    for row in rows:
         if buffer.size == 0:
-            writer.writeheader()
+            buffer.write(header)
             if carry_over is not None:
-                buffer.write(carry_over.decode("utf-8"))
+                buffer.write_bytes(carry_over)
                 carry_over = None
-        writer.writerow(row)
+        buffer.write(",".join(map(_format_field, row)) + "\n")
         # -1 to account for the header
         if buffer.size >= max_size_bytes or (buffer.n_rows - 1) >= max_records:
             if buffer.size > max_size_bytes or (buffer.n_rows - 1) > max_records:
@@ -197,5 +269,9 @@ def deserialize_ingest_results(data: bytes) -> list[dict[str, str]]:
         List of records as dictionaries.
 
     """
-    reader = csv.DictReader(data.decode("utf-8").splitlines())
+    # newline="" is required by the csv module - universal-newline translation
+    # would rewrite \r\n sequences inside quoted fields
+    reader = csv.DictReader(
+        io.TextIOWrapper(io.BytesIO(data), encoding="utf-8", newline="")
+    )
     return list(reader)
@@ -41,14 +41,9 @@ class BulkClientV2:
 
     def __init__(self, salesforce_client: "Salesforce") -> None:
         self.salesforce_client = salesforce_client
-        self.base_url = "/".join(
-            [
-                self.salesforce_client.base_url,
-                "services",
-                "data",
-                f"v{self.salesforce_client.version}",
-                "jobs",
-            ]
+        self.base_url = (
+            f"{salesforce_client.base_url}/services/data"
+            f"/v{salesforce_client.version}/jobs"
         )
 
     @cached_property
@@ -9,12 +9,17 @@ from typing import (
     AsyncIterator,
     Collection,
     Iterable,
+    Iterator,
     Literal,
     Self,
     TypeAlias,
 )
 
-from httpx import Response
+try:
+    # Optional C-accelerated ISO-8601 parser
+    from ciso8601 import parse_datetime  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover
+    parse_datetime = datetime.datetime.fromisoformat
 
 from aiosalesforce.events import BulkApiBatchConsumptionEvent
 from aiosalesforce.utils import json_dumps, json_loads
@@ -32,6 +37,19 @@ OperationType: TypeAlias = Literal[
     "upsert",
 ]
 
+# Job states in which an ingest job has not yet finished processing
+ACTIVE_JOB_STATES = frozenset({"Open", "UploadComplete", "InProgress"})
+
+
+def _to_camel_case(name: str) -> str:
+    first, *rest = name.split("_")
+    return first + "".join(component.capitalize() for component in rest)
+
+
+def _next_chunk(chunks: Iterator[bytes]) -> bytes | None:
+    """Advance the serializer by one chunk, returning None when exhausted."""
+    return next(chunks, None)
+
 
 @dataclasses.dataclass
 class JobInfo:
@@ -68,29 +86,30 @@ class JobInfo:
     ]
 
     @classmethod
-    def from_json(cls, data: bytes) -> Self:
-        job_info = cls(
-            **{
-                field.name: (_ := json_loads(data)).get(
-                    "".join(
-                        [
-                            component.capitalize() if i > 0 else component
-                            for i, component in enumerate(field.name.split("_"))
-                        ]
-                    ),
-                    None,
-                )
-                for field in dataclasses.fields(cls)
-            }
-        )
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        kwargs: dict[str, Any] = {
+            name: data.get(key) for name, key in _JOB_INFO_FIELD_KEYS
+        }
+        job_info = cls(**kwargs)
         for attr in ["created_date", "system_modstamp"]:
             setattr(
                 job_info,
                 attr,
-                datetime.datetime.fromisoformat(getattr(job_info, attr)),
+                parse_datetime(getattr(job_info, attr)),
             )
         return job_info
 
+    @classmethod
+    def from_json(cls, data: bytes) -> Self:
+        return cls.from_dict(json_loads(data))
+
+
+# Maps JobInfo field names to their camelCase keys in API responses,
+# computed once instead of on every parsed job
+_JOB_INFO_FIELD_KEYS = tuple(
+    (field.name, _to_camel_case(field.name)) for field in dataclasses.fields(JobInfo)
+)
+
 
 @dataclasses.dataclass
 class JobResult:
@@ -231,7 +250,7 @@ class BulkIngestClient:
                 )
             response_json: dict = json_loads(response.content)
             for record in response_json["records"]:
-                yield JobInfo.from_json(json_dumps(record))
+                yield JobInfo.from_dict(record)
             next_url = response_json.get("nextRecordsUrl", None)
             if next_url is None:
                 break
@@ -309,6 +328,10 @@ class BulkIngestClient:
             content=json_dumps({"state": "UploadComplete"}),
             headers={"Content-Type": "application/json", "Accept": "application/json"},
         )
+        # First row is header and is not counted
+        n_records = data.count(b"\n") - 1
+        if not data.endswith(b"\n"):
+            n_records += 1
         await self.bulk_client.salesforce_client.event_bus.publish_event(
             BulkApiBatchConsumptionEvent(
                 type="bulk_api_batch_consumption",
@@ -317,7 +340,7 @@ class BulkIngestClient:
                 #      consumed in a job. Number of batches is estimated based on the
                 #      Salesforce docs saying that a separate batch is created for every
                 #      10,000 records in data. First row is header and is not counted.
-                count=math.ceil((len(data.strip(b"\n").split(b"\n")) - 1) / 10_000),
+                count=math.ceil(n_records / 10_000),
             )
         )
         return JobInfo.from_json(response.content)
@@ -338,37 +361,33 @@ class BulkIngestClient:
             assignment_rule_id=assignment_rule_id,
         )
         job = await self.upload_job_data(job.id, data)
-        while job.state.lower().strip(" ") in {"open", "uploadcomplete", "inprogress"}:
+        while job.state in ACTIVE_JOB_STATES:
             await asyncio.sleep(polling_interval)
             job = await self.get_job(job.id)
 
-        tasks: list[asyncio.Task[Response]] = []
+        async def fetch_results(type_: str) -> list[dict[str, str]]:
+            response = await self.bulk_client.salesforce_client.request(
+                "GET",
+                f"{self.base_url}/{job.id}/{type_}",
+            )
+            # Parse in a worker thread so deserialization of one result type
+            # overlaps with downloads of the others
+            return await asyncio.to_thread(deserialize_ingest_results, response.content)
+
+        tasks: list[asyncio.Task[list[dict[str, str]]]] = []
         async with asyncio.TaskGroup() as tg:
             for type_ in [
                 "successfulResults",
                 "failedResults",
                 "unprocessedrecords",
             ]:
-                tasks.append(
-                    tg.create_task(
-                        self.bulk_client.salesforce_client.request(
-                            "GET",
-                            f"{self.base_url}/{job.id}/{type_}",
-                        )
-                    )
-                )
+                tasks.append(tg.create_task(fetch_results(type_)))
 
         return JobResult(
             job_info=job,
-            successful_results=deserialize_ingest_results(
-                tasks[0].result().content,
-            ),
-            failed_results=deserialize_ingest_results(
-                tasks[1].result().content,
-            ),
-            unprocessed_records=deserialize_ingest_results(
-                tasks[2].result().content,
-            ),
+            successful_results=tasks[0].result(),
+            failed_results=tasks[1].result(),
+            unprocessed_records=tasks[2].result(),
         )
 
     async def perform_operation(
@@ -382,6 +401,7 @@ class BulkIngestClient:
         external_id_field: str | None = None,
         assignment_rule_id: str | None = None,
         polling_interval: float = 5.0,
+        max_concurrent_jobs: int = 4,
     ) -> AsyncIterator[JobResult]:
         """
         Perform a bulk ingest operation.
@@ -416,6 +436,10 @@ class BulkIngestClient:
         polling_interval : float, optional
             Interval in seconds to poll the job status.
             By default 5.0 seconds.
+        max_concurrent_jobs : int, optional
+            Maximum number of ingest jobs processed at the same time.
+            By default 4. Bounds peak memory at roughly
+            `max_concurrent_jobs * max_size_bytes`.
 
         Yields
         ------
@@ -424,14 +448,26 @@ class BulkIngestClient:
             and unprocessed records.
 
         """
-        tasks: list[asyncio.Task[JobResult]] = []
-        for csv_payload in serialize_ingest_data(
-            data,
-            fieldnames=fieldnames,
-            max_size_bytes=max_size_bytes,
-            max_records=max_records,
-        ):
-            tasks.append(
+        pending: set[asyncio.Task[JobResult]] = set()
+        # Chunks are produced in a worker thread so that serializing large
+        # payloads doesn't block the event loop while earlier chunks upload
+        chunks = iter(
+            serialize_ingest_data(
+                data,
+                fieldnames=fieldnames,
+                max_size_bytes=max_size_bytes,
+                max_records=max_records,
+            )
+        )
+        while (csv_payload := await asyncio.to_thread(_next_chunk, chunks)) is not None:
+            while len(pending) >= max_concurrent_jobs:
+                done, pending = await asyncio.wait(
+                    pending,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    yield task.result()
+            pending.add(
                 asyncio.create_task(
                     self.__perform_operation(
                         operation,
@@ -443,5 +479,10 @@ class BulkIngestClient:
                     )
                 )
             )
-        for future in asyncio.as_completed(tasks):
-            yield await future
+        while pending:
+            done, pending = await asyncio.wait(
+                pending,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in done:
+                yield task.result()
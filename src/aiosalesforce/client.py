@@ -3,8 +3,8 @@ import logging
 import re
 import warnings
 
-from functools import cached_property, wraps
-from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, NoReturn
+from functools import cached_property
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Mapping, NoReturn
 
 import httpx
 
@@ -25,6 +25,21 @@ from aiosalesforce.utils import json_loads
 
 logger = logging.getLogger(__name__)
 
+# Compiled once so client construction doesn't pay for pattern compilation
+_API_VERSION_RE = re.compile(r"^(v)?(\d+)(\.(0)?)?$")
+_BASE_URL_RE = re.compile(
+    r"(https://[a-zA-Z0-9-]+(\.(sandbox|develop))?\.my\.salesforce\.com).*"
+)
+
+# Headers attached to every request; normalized once instead of per request
+_STATIC_HEADERS = httpx.Headers(
+    {
+        "User-Agent": f"aiosalesforce/{__version__}",
+        "Sforce-Call-Options": f"client=aiosalesforce/{__version__}",
+        "Sforce-Line-Ending": "LF",
+    }
+)
+
 
 class Salesforce:
     """
@@ -34,6 +49,10 @@ class Salesforce:
     ----------
     httpx_client : httpx.AsyncClient
         HTTP client.
+        Reuse a single long-lived client with keepalive connections enabled
+        (e.g., one created by `aiosalesforce.default_client`) so that requests
+        and token refreshes reuse TCP/TLS sessions instead of performing a new
+        handshake each time.
     base_url : str
         Base URL of the Salesforce instance.
         Must be in the format:\n
@@ -69,6 +88,8 @@ class Salesforce:
     event_bus: EventBus
     retry_policy: RetryPolicy
     _semaphore: asyncio.Semaphore
+    _bearer_token: str | None
+    _bearer_header: str
 
     def __init__(
         self,
@@ -81,6 +102,9 @@ class Salesforce:
         concurrency_limit: int = 100,
     ) -> None:
         self.httpx_client = httpx_client
+        # httpx merges client-level headers into every request it builds,
+        # keeping the per-request path down to the Authorization header
+        httpx_client.headers.update(_STATIC_HEADERS)
         self.base_url = base_url
         self.auth = auth
         self.version = version
@@ -88,6 +112,8 @@ class Salesforce:
         self.event_bus = EventBus(event_hooks)
         self.retry_policy = retry_policy or RetryPolicy()
         self._semaphore = asyncio.Semaphore(concurrency_limit)
+        self._bearer_token = None
+        self._bearer_header = ""
 
     @property
     def version(self) -> str:
@@ -96,12 +122,13 @@ class Salesforce:
 
     @version.setter
     def version(self, value: str) -> None:
-        if not (match_ := re.fullmatch(r"^(v)?(\d+)(\.(0)?)?$", value)):
+        if not (match_ := _API_VERSION_RE.fullmatch(value)):
             raise ValueError(
                 f"Invalid Salesforce API version: '{value}'. "
                 f"A valid version should look like '60.0'."
             )
         self.__version = f"{match_.groups()[1]}.0"
+        self.__dict__.pop("_data_prefix", None)
 
     @property
     def base_url(self) -> str:
@@ -110,10 +137,7 @@ class Salesforce:
 
     @base_url.setter
     def base_url(self, value: str) -> None:
-        match_ = re.fullmatch(
-            r"(https://[a-zA-Z0-9-]+(\.(sandbox|develop))?\.my\.salesforce\.com).*",
-            value.strip(" ").lower(),
-        )
+        match_ = _BASE_URL_RE.fullmatch(value.strip(" ").lower())
         if not match_:
             raise ValueError(
                 "\n".join(
@@ -127,28 +151,61 @@ class Salesforce:
                 )
             )
         self.__base_url = str(match_.groups()[0])
+        self.__dict__.pop("_data_prefix", None)
+
+    def _authorization_header(self, access_token: str) -> str:
+        """Format the Authorization header, reusing it while the token is unchanged."""
+        if access_token != self._bearer_token:
+            self._bearer_token = access_token
+            self._bearer_header = f"Bearer {access_token}"
+        return self._bearer_header
 
-    @wraps(httpx.AsyncClient.request)
-    async def request(self, *args, **kwargs) -> httpx.Response:
+    @cached_property
+    def _data_prefix(self) -> str:
+        """Base URL for REST API data endpoints, e.g., .../services/data/v60.0"""
+        return f"{self.base_url}/services/data/v{self.version}"
+
+    async def request(
+        self,
+        method: str,
+        url: str | httpx.URL,
+        *,
+        content: str | bytes | None = None,
+        data: Mapping[str, Any] | None = None,
+        files: Any | None = None,
+        json: Any | None = None,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        cookies: Any | None = None,
+        timeout: Any = httpx.USE_CLIENT_DEFAULT,
+        extensions: Mapping[str, Any] | None = None,
+    ) -> httpx.Response:
         """
         Make an HTTP request to Salesforce.
 
+        Accepts the same arguments as `httpx.AsyncClient.build_request`.
         Raises an appropriate exception if the request is not successful.
 
         """
-        request = self.httpx_client.build_request(*args, **kwargs)
-        access_token = await self.auth.get_access_token(self)
-        request.headers.update(
-            {
-                "Authorization": f"Bearer {access_token}",
-                "User-Agent": f"aiosalesforce/{__version__}",
-                "Sforce-Call-Options": f"client=aiosalesforce/{__version__}",
-                "Sforce-Line-Ending": "LF",
-            }
-        )
-        await self.event_bus.publish_event(
-            RequestEvent(type="request", request=request)
+        request = self.httpx_client.build_request(
+            method,
+            url,
+            content=content,
+            data=data,
+            files=files,
+            json=json,
+            params=params,
+            headers=headers,
+            cookies=cookies,
+            timeout=timeout,
+            extensions=extensions,
         )
+        access_token = await self.auth.get_access_token(self)
+        request.headers["Authorization"] = self._authorization_header(access_token)
+        if self.event_bus.has_callbacks:
+            await self.event_bus.publish_event(
+                RequestEvent(type="request", request=request)
+            )
         retry_context = self.retry_policy.create_context()
         response = await retry_context.send_request_with_retries(
             httpx_client=self.httpx_client,
@@ -157,21 +214,26 @@ class Salesforce:
             request=request,
         )
         if response.status_code == 401:
-            access_token = await self.auth.refresh_access_token(self)
-            request.headers["Authorization"] = f"Bearer {access_token}"
-            response = await retry_context.send_request_with_retries(
-                httpx_client=self.httpx_client,
-                event_bus=self.event_bus,
-                semaphore=self._semaphore,
-                request=request,
-            )
+            new_token = await self.auth.refresh_access_token(self)
+            # If the refresh produced the same token (e.g., another coroutine
+            # already refreshed it before this request was sent), resending
+            # would be rejected identically - fall through and raise below
+            if new_token != access_token:
+                request.headers["Authorization"] = self._authorization_header(new_token)
+                response = await retry_context.send_request_with_retries(
+                    httpx_client=self.httpx_client,
+                    event_bus=self.event_bus,
+                    semaphore=self._semaphore,
+                    request=request,
+                )
         if not response.is_success:
             raise_salesforce_error(response)
         if "Warning" in response.headers:
             warnings.warn(response.headers["Warning"], SalesforceWarning)
-        await self.event_bus.publish_event(
-            ResponseEvent(type="response", response=response)
-        )
+        if self.event_bus.has_callbacks:
+            await self.event_bus.publish_event(
+                ResponseEvent(type="response", response=response)
+            )
         return response
 
     async def get_limits(self) -> dict[str, Any]:
@@ -186,7 +248,7 @@ class Salesforce:
         """
         response = await self.request(
             "GET",
-            f"{self.base_url}/services/data/v{self.version}/limits",
+            f"{self._data_prefix}/limits",
             headers={"Accept": "application/json"},
         )
         return json_loads(response.content)
@@ -211,30 +273,65 @@ class Salesforce:
         dict
             Record.
 
+        """
+        async for batch in self.query_batches(query, include_all_records):
+            for record in batch:
+                yield record
+
+    async def query_batches(
+        self,
+        query: str,
+        include_all_records: bool = False,
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Execute a SOQL query, yielding records one page at a time.
+
+        Prefer this over `query` when records are consumed in bulk -
+        the generator is resumed once per page instead of once per record.
+
+        Parameters
+        ----------
+        query : str
+            SOQL query.
+        include_all_records : bool, default False
+            If True, includes all (active/deleted/archived) records.
+
+        Yields
+        -------
+        list[dict]
+            Records from a single page.
+
         """
         operation = "query" if not include_all_records else "queryAll"
 
-        next_url: str | None = None
+        response = await self.request(
+            "GET",
+            f"{self._data_prefix}/{operation}",
+            params={"q": query},
+            headers={"Accept": "application/json"},
+        )
         while True:
-            if next_url is None:
-                response = await self.request(
-                    "GET",
-                    f"{self.base_url}/services/data/v{self.version}/{operation}",
-                    params={"q": query},
-                    headers={"Accept": "application/json"},
-                )
-            else:
-                response = await self.request(
-                    "GET",
-                    f"{self.base_url}{next_url}",
-                    headers={"Accept": "application/json"},
-                )
             response_json: dict = json_loads(response.content)
-            for record in response_json["records"]:
-                yield record
             next_url = response_json.get("nextRecordsUrl", None)
-            if next_url is None:
+            next_page: asyncio.Task[httpx.Response] | None = None
+            if next_url is not None:
+                # Fetch the next page while the caller consumes this one
+                next_page = asyncio.create_task(
+                    self.request(
+                        "GET",
+                        f"{self.base_url}{next_url}",
+                        headers={"Accept": "application/json"},
+                    )
+                )
+            try:
+                yield response_json["records"]
+            except BaseException:
+                if next_page is not None:
+                    next_page.cancel()
+                raise
+            if next_page is None:
                 break
+            response = await next_page
 
     @cached_property
     def sobject(self) -> SobjectClient:
@@ -50,6 +50,11 @@ class EventBus:
         """
         self._callbacks.discard(callback)
 
+    @property
+    def has_callbacks(self) -> bool:
+        """Whether any callbacks are subscribed to the event bus."""
+        return bool(self._callbacks)
+
     @staticmethod
     async def __dispatch_event_to_callback(
         callback: CallbackType, event: Event
@@ -61,6 +66,24 @@ class EventBus:
 
     async def publish_event(self, event: Event) -> None:
         """Publish an event and dispatch it to all subscribed callbacks."""
+        if not self._callbacks:
+            return
         async with asyncio.TaskGroup() as tg:
             for callback in self._callbacks:
                 tg.create_task(self.__dispatch_event_to_callback(callback, event))
+
+    async def publish_events(self, events: Iterable[Event]) -> None:
+        """
+        Publish multiple events in a single dispatch round.
+
+        Equivalent to awaiting `publish_event` for each event, but all
+        callbacks are scheduled together, costing one event loop trip
+        instead of one per event.
+
+        """
+        if not self._callbacks:
+            return
+        async with asyncio.TaskGroup() as tg:
+            for event in events:
+                for callback in self._callbacks:
+                    tg.create_task(self.__dispatch_event_to_callback(callback, event))
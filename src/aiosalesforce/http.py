@@ -0,0 +1,61 @@
+import httpx
+
+try:
+    import h2  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover
+    h2 = None
+
+
+def default_client(
+    *,
+    max_connections: int = 200,
+    max_keepalive_connections: int = 50,
+    keepalive_expiry: float = 60.0,
+    http2: bool | None = None,
+    timeout: float = 30.0,
+    **kwargs,
+) -> httpx.AsyncClient:
+    """
+    Create an httpx client preconfigured for use with the Salesforce client.
+
+    The default httpx connection limits (100 connections, 20 keepalive)
+    are a common throughput bottleneck for bursts of concurrent requests.
+    This factory raises the keepalive pool so that repeated requests to the
+    same Salesforce instance reuse TCP/TLS sessions instead of
+    re-establishing them.
+
+    Parameters
+    ----------
+    max_connections : int, optional
+        Maximum number of concurrent connections. By default 200.
+    max_keepalive_connections : int, optional
+        Maximum number of idle keepalive connections. By default 50.
+    keepalive_expiry : float, optional
+        Time in seconds an idle connection is kept open. By default 60.
+    http2 : bool, optional
+        Whether to enable HTTP/2.
+        By default enabled if the h2 package is installed
+        (install with `httpx[http2]`).
+    timeout : float, optional
+        Timeout in seconds for all operations. By default 30.
+    **kwargs
+        Additional arguments passed to httpx.AsyncClient.
+
+    Returns
+    -------
+    httpx.AsyncClient
+        Preconfigured HTTP client.
+
+    """
+    if http2 is None:
+        http2 = h2 is not None
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        http2=http2,
+        timeout=timeout,
+        **kwargs,
+    )
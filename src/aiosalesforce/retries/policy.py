@@ -138,38 +138,45 @@ class RetryContext(RetryBase):
                     response = await httpx_client.send(request)
             except Exception as exc:
                 if await self.should_retry(exc):
-                    await asyncio.gather(
-                        self.sleep(),
-                        event_bus.publish_event(
+                    if event_bus.has_callbacks:
+                        # Start the backoff sleep first so it overlaps with
+                        # event dispatch instead of running after it
+                        sleep_task = asyncio.create_task(self.sleep())
+                        await event_bus.publish_event(
                             RetryEvent(
                                 type="retry",
                                 attempt=self.retry_count["total"],
                                 request=request,
                                 exception=exc,
                             )
-                        ),
-                    )
+                        )
+                        await sleep_task
+                    else:
+                        await self.sleep()
                     continue
                 raise
-            await event_bus.publish_event(
-                RestApiCallConsumptionEvent(
-                    type="rest_api_call_consumption",
-                    response=response,
-                    count=1,
+            if event_bus.has_callbacks:
+                await event_bus.publish_event(
+                    RestApiCallConsumptionEvent(
+                        type="rest_api_call_consumption",
+                        response=response,
+                        count=1,
+                    )
                 )
-            )
             if not response.is_success and await self.should_retry(response):
-                await asyncio.gather(
-                    self.sleep(),
-                    event_bus.publish_event(
+                if event_bus.has_callbacks:
+                    sleep_task = asyncio.create_task(self.sleep())
+                    await event_bus.publish_event(
                         RetryEvent(
                             type="retry",
                             attempt=self.retry_count["total"],
                             request=request,
                             response=response,
                         )
-                    ),
-                )
+                    )
+                    await sleep_task
+                else:
+                    await self.sleep()
                 continue
             return response
 
@@ -1,15 +1,21 @@
 import asyncio
+import contextlib
 import pathlib
 import time
 
+from types import SimpleNamespace
+from typing import Generator
 from unittest.mock import AsyncMock
 from urllib.parse import parse_qs
 
+import aiosalesforce.auth.base
+import aiosalesforce.auth.client_credentials_flow
+import aiosalesforce.auth.jwt_bearer_flow
+import aiosalesforce.auth.soap
 import httpx
 import jwt
 import pytest
 import respx
-import time_machine
 
 from aiosalesforce.auth import Auth, ClientCredentialsFlow, JwtBearerFlow, SoapLogin
 from aiosalesforce.client import Salesforce
@@ -20,6 +26,30 @@ from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric.rsa import generate_private_key
 
 
+@contextlib.contextmanager
+def travel_monotonic(offset: float) -> Generator[None, None, None]:
+    """Shift the monotonic clock used by the auth modules for token TTLs."""
+    modules = [
+        aiosalesforce.auth.base,
+        aiosalesforce.auth.client_credentials_flow,
+        aiosalesforce.auth.jwt_bearer_flow,
+        aiosalesforce.auth.soap,
+    ]
+    real_monotonic = time.monotonic
+    fake_time = SimpleNamespace(
+        time=time.time,
+        monotonic=lambda: real_monotonic() + offset,
+    )
+    originals = [module.time for module in modules]
+    for module in modules:
+        module.time = fake_time  # type: ignore[assignment]
+    try:
+        yield
+    finally:
+        for module, original in zip(modules, originals, strict=True):
+            module.time = original
+
+
 @pytest.fixture(scope="function")
 def pseudo_client(config: dict[str, str], httpx_client: httpx.AsyncClient):
     """Imitate a Salesforce client to test authentication."""
@@ -55,6 +85,76 @@ class TestBaseAuth:
         assert tokens[0] == "test-token"
         func.assert_awaited_once_with(pseudo_client)
 
+    async def test_proactive_refresh(self, pseudo_client: Salesforce):
+        """Stale (but not expired) token is refreshed in the background."""
+        get_func = AsyncMock()
+        get_func.return_value = "test-token-before"
+        refresh_func = AsyncMock()
+        refresh_func.return_value = "test-token-after"
+        auth = type(
+            "CustomAuth",
+            (Auth,),
+            {
+                "_acquire_new_access_token": get_func,
+                "_refresh_access_token": refresh_func,
+            },
+        )()
+
+        token = await auth.get_access_token(pseudo_client)
+        assert token == "test-token-before"  # noqa: S105
+
+        # Make the token stale but not expired
+        auth._expiration_time = time.monotonic() + 3600
+        auth._stale_time = time.monotonic() - 1
+        assert auth.stale
+        assert not auth.expired
+
+        # Stale token is returned immediately while the refresh runs
+        token = await auth.get_access_token(pseudo_client)
+        assert token == "test-token-before"  # noqa: S105
+        for _ in range(3):
+            await asyncio.sleep(0)
+        refresh_func.assert_awaited_once_with(pseudo_client)
+        token = await auth.get_access_token(pseudo_client)
+        assert token == "test-token-after"  # noqa: S105
+
+    async def test_proactive_refresh_failure_cooldown(self, pseudo_client: Salesforce):
+        """Failed background refresh backs off instead of retrying per call."""
+        get_func = AsyncMock()
+        get_func.return_value = "test-token"
+        refresh_func = AsyncMock(side_effect=AuthenticationError("IdP is down"))
+        auth = type(
+            "CustomAuth",
+            (Auth,),
+            {
+                "_acquire_new_access_token": get_func,
+                "_refresh_access_token": refresh_func,
+            },
+        )()
+
+        token = await auth.get_access_token(pseudo_client)
+        assert token == "test-token"  # noqa: S105
+
+        # Make the token stale but not expired
+        auth._expiration_time = time.monotonic() + 3600
+        auth._stale_time = time.monotonic() - 1
+        assert auth.stale
+
+        token = await auth.get_access_token(pseudo_client)
+        assert token == "test-token"  # noqa: S105
+        for _ in range(3):
+            await asyncio.sleep(0)
+        refresh_func.assert_awaited_once_with(pseudo_client)
+
+        # The failure pushed the stale time forward, so subsequent calls
+        # do not start another refresh during the cooldown
+        assert not auth.stale
+        token = await auth.get_access_token(pseudo_client)
+        assert token == "test-token"  # noqa: S105
+        for _ in range(3):
+            await asyncio.sleep(0)
+        refresh_func.assert_awaited_once_with(pseudo_client)
+
     async def test_refresh_access_token_error(self, pseudo_client: Salesforce):
         auth = type(
             "CustomAuth",
@@ -68,8 +168,13 @@ class TestBaseAuth:
         """Token is refreshed only once when called multiple times concurrently."""
         get_func = AsyncMock()
         get_func.return_value = "test-token-before"
-        refresh_func = AsyncMock()
-        refresh_func.return_value = "test-token-after"
+        gate = asyncio.Event()
+
+        async def slow_refresh(client) -> str:
+            await gate.wait()
+            return "test-token-after"
+
+        refresh_func = AsyncMock(side_effect=slow_refresh)
         auth = type(
             "CustomAuth",
             (Auth,),
@@ -84,11 +189,10 @@ class TestBaseAuth:
         assert token == "test-token-before"  # noqa: S105
         get_func.assert_awaited_once_with(pseudo_client)
 
-        # To ensure all refreshes are concurrent lock is held until
-        # all of the tasks are waiting for it
+        # To ensure all refreshes are concurrent the first refresh is blocked
+        # until all of the tasks are waiting for it
         tasks: list[asyncio.Task[str]] = []
         async with asyncio.TaskGroup() as tg:
-            await auth._Auth__lock.acquire()
             for _ in range(10):
                 tasks.append(
                     tg.create_task(
@@ -96,9 +200,9 @@ class TestBaseAuth:
                     )
                 )
             # Yield control to the event loop to allow the tasks to start
-            # and reach a point where they are waiting for the lock
+            # and reach a point where they are waiting for the refresh
             await asyncio.sleep(0)
-            auth._Auth__lock.release()
+            gate.set()
         tokens = [task.result() for task in tasks]
         assert len(tokens) == 10
         assert len(set(tokens)) == 1
@@ -137,12 +241,9 @@ class TestSoapLogin:
         )
         await auth.get_access_token(pseudo_client)
         assert auth._expiration_time is not None
-        assert auth._expiration_time > time.time()
+        assert auth._expiration_time > time.monotonic()
         assert not auth.expired
-        with time_machine.travel(
-            time.time() + 60 * 60 * 24,
-            tick=False,
-        ):
+        with travel_monotonic(60 * 60 * 24):
             assert auth.expired
             await auth.get_access_token(pseudo_client)
             assert not auth.expired
@@ -203,15 +304,60 @@ class TestClientCredentialsFlow:
         access_token = await auth.get_access_token(pseudo_client)
         assert access_token == expected_access_token
         assert not auth.expired
-        with time_machine.travel(
-            time.time() + 1e9,
-            tick=False,
-        ):
+        with travel_monotonic(1e9):
             # Access token for the Client Credentials Flow never expires
             # if timeout is not set
             assert not auth.expired
         assert event_hook.await_count == 3
 
+    async def test_shared_cache_refresh(
+        self,
+        config: dict[str, str],
+        pseudo_client: Salesforce,
+        httpx_mock_router: respx.MockRouter,
+    ):
+        """Refresh must bypass the shared cache and evict the stale token."""
+
+        def token_response(access_token: str) -> httpx.Response:
+            return httpx.Response(
+                status_code=200,
+                json={
+                    "access_token": access_token,
+                    "instance_url": "https://example.salesforce.com",
+                    "id": (
+                        "https://login.salesforce.com/id"
+                        "/00Dxx0000000000AAA/005xx0000000xxxAAA"
+                    ),
+                    "token_type": "Bearer",
+                    "scope": "full",
+                    "issued_at": int(time.time()),
+                    "signature": "SUPER-SECRET-SIGNATURE",
+                },
+            )
+
+        httpx_mock_router.post(
+            f"{config['base_url']}/services/oauth2/token",
+        ).mock(
+            side_effect=[token_response("token-1"), token_response("token-2")],
+        )
+
+        auth = ClientCredentialsFlow(
+            client_id="shared-cache-client-id",
+            client_secret="shared-cache-client-secret",  # noqa: S106
+            share_cache=True,
+        )
+        assert await auth.get_access_token(pseudo_client) == "token-1"
+        # Refresh (e.g., after a 401) must not hand back the cached token
+        assert await auth.refresh_access_token(pseudo_client) == "token-2"
+
+        # The refreshed token replaced the stale cache entry
+        other_auth = ClientCredentialsFlow(
+            client_id="shared-cache-client-id",
+            client_secret="shared-cache-client-secret",  # noqa: S106
+            share_cache=True,
+        )
+        assert await other_auth.get_access_token(pseudo_client) == "token-2"
+
     async def test_expiration(
         self,
         config: dict[str, str],
@@ -251,18 +397,43 @@ class TestClientCredentialsFlow:
         assert event_hook.await_count == 3
         assert access_token == expected_access_token
         assert auth._expiration_time is not None
-        assert auth._expiration_time > time.time()
+        assert auth._expiration_time > time.monotonic()
         assert not auth.expired
-        with time_machine.travel(
-            time.time() + 1e9,
-            tick=False,
-        ):
+        with travel_monotonic(1e9):
             assert auth.expired
             access_token = await auth.get_access_token(pseudo_client)
             assert access_token == expected_access_token
             assert not auth.expired
         assert event_hook.await_count == 6
 
+    async def test_shared_token_cache(
+        self,
+        config: dict[str, str],
+        pseudo_client: Salesforce,
+        httpx_mock_router: respx.MockRouter,
+    ):
+        aiosalesforce.auth.client_credentials_flow._SHARED_TOKENS.clear()
+        route = httpx_mock_router.post(
+            f"{config['base_url']}/services/oauth2/token",
+        ).mock(
+            httpx.Response(
+                status_code=200,
+                json={"access_token": "SHARED-ACCESS-TOKEN"},
+            )
+        )
+        flows = [
+            ClientCredentialsFlow(
+                client_id="shared-client-id",
+                client_secret="shared-client-secret",  # noqa: S106
+                share_cache=True,
+            )
+            for _ in range(2)
+        ]
+        for flow in flows:
+            access_token = await flow.get_access_token(pseudo_client)
+            assert access_token == "SHARED-ACCESS-TOKEN"  # noqa: S105
+        assert route.call_count == 1
+
     async def test_invalid_credentials(
         self,
         config: dict[str, str],
@@ -362,10 +533,7 @@ class TestJwtBearerFlow:
         access_token = await auth.get_access_token(pseudo_client)
         assert access_token == expected_access_token
         assert not auth.expired
-        with time_machine.travel(
-            time.time() + 1e9,
-            tick=False,
-        ):
+        with travel_monotonic(1e9):
             # Access token for the JWT Bearer Flow never expires if timeout is not set
             assert not auth.expired
         assert event_hook.await_count == 3
@@ -434,12 +602,9 @@ class TestJwtBearerFlow:
         assert event_hook.await_count == 3
         assert access_token == expected_access_token
         assert auth._expiration_time is not None
-        assert auth._expiration_time > time.time()
+        assert auth._expiration_time > time.monotonic()
         assert not auth.expired
-        with time_machine.travel(
-            time.time() + 1e9,
-            tick=False,
-        ):
+        with travel_monotonic(1e9):
             assert auth.expired
             access_token = await auth.get_access_token(pseudo_client)
             assert access_token == expected_access_token
@@ -8,6 +8,7 @@ import pytest
 
 from aiosalesforce.bulk.v2._csv import (
     _serialize_dict,
+    _serialize_scalar,
     _serialize_value,
     deserialize_ingest_results,
     serialize_ingest_data,
@@ -61,6 +62,14 @@ class TestValueSerializer:
         with pytest.raises(TypeError, match="Invalid value type"):
             _serialize_value(object())
 
+    def test_equal_values_of_different_types(self):
+        """Memoization must not collapse equal values of different types."""
+        values = [True, 1, 1.0, False, 0, 0.0]
+        expected = ["true", "1", "1.0", "false", "0", "0.0"]
+        assert [_serialize_scalar(value) for value in values] == expected
+        # Same values again, this time served from the cache
+        assert [_serialize_scalar(value) for value in values] == expected
+
 
 class TestDictSerializer:
     def test_empty(self):
@@ -223,3 +232,11 @@ class TestCsvSerializer:
             ]
         )
         assert len(deserialize_ingest_results(csvs[-1])) == 10
+
+
+class TestCsvDeserializer:
+    def test_crlf_in_quoted_field(self):
+        """Newline sequences inside quoted fields must survive round-trip."""
+        data = b'sf__Id,sf__Error\n001,"First line\r\nSecond line"\n'
+        records = deserialize_ingest_results(data)
+        assert records == [{"sf__Id": "001", "sf__Error": "First line\r\nSecond line"}]
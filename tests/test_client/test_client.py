@@ -19,6 +19,23 @@ from aiosalesforce.auth import SoapLogin
 from aiosalesforce.exceptions import SalesforceError, SalesforceWarning, ServerError
 
 
+def soap_login_response(session_id: str) -> httpx.Response:
+    """Minimal successful SOAP login response with the given session ID."""
+    return httpx.Response(
+        status_code=200,
+        content=(
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            "<soapenv:Envelope "
+            'xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/" '
+            'xmlns="urn:partner.soap.sforce.com">'
+            "<soapenv:Body><loginResponse><result>"
+            f"<sessionId>{session_id}</sessionId>"
+            "<sessionSecondsValid>7200</sessionSecondsValid>"
+            "</result></loginResponse></soapenv:Body></soapenv:Envelope>"
+        ).encode("utf-8"),
+    )
+
+
 class TestInit:
     def test_default(
         self,
@@ -389,6 +406,15 @@ class TestRequest:
                 httpx.Response(status_code=200),
             ],
         )
+        # Refresh must yield a new session ID (unchanged token is not resent)
+        httpx_mock_router.post(
+            f"{config['base_url']}/services/Soap/u/{config['api_version']}",
+        ).mock(
+            side_effect=[
+                soap_login_response("SESSION-ID-1"),
+                soap_login_response("SESSION-ID-2"),
+            ],
+        )
 
         # Subscribe a mock event hook
         event_hook = AsyncMock()
@@ -420,6 +446,15 @@ class TestRequest:
                 httpx.Response(status_code=401),
             ],
         )
+        # Refresh must yield a new session ID (unchanged token is not resent)
+        httpx_mock_router.post(
+            f"{config['base_url']}/services/Soap/u/{config['api_version']}",
+        ).mock(
+            side_effect=[
+                soap_login_response("SESSION-ID-1"),
+                soap_login_response("SESSION-ID-2"),
+            ],
+        )
 
         # Subscribe a mock event hook
         event_hook = AsyncMock()
@@ -583,3 +618,42 @@ class TestSoql:
         # - 3 for auth (request, consumption, response)
         # - 9 for request (request, consumption, response) x 3
         assert event_hook.await_count == 12
+
+    async def test_query_batches(
+        self,
+        config: dict[str, str],
+        httpx_mock_router: respx.MockRouter,
+        salesforce: Salesforce,
+    ):
+        query = "SELECT Id FROM Contact WHERE Email = 'jdoe@example.com'"
+
+        # Mock requests
+        url = f"{config['base_url']}/services/data/v{config['api_version']}/query"
+        for i in range(2):
+            response_json = {
+                "done": i == 1,
+                "totalSize": 4000,
+                "records": [
+                    {"Id": f"00300000000000{j}"}
+                    for j in range(i * 2000, (i + 1) * 2000)
+                ],
+            }
+            if i < 1:
+                response_json["nextRecordsUrl"] = (
+                    f"/services/data/v{config['api_version']}/query/01g00000000000{i+1}"
+                )
+            httpx_mock_router.get(
+                url if i == 0 else url + f"/01g00000000000{i}",
+                params={"q": query} if i == 0 else None,
+            ).mock(
+                return_value=httpx.Response(
+                    status_code=200,
+                    json=response_json,
+                ),
+            )
+
+        # Execute query
+        batches = []
+        async for batch in salesforce.query_batches(query):
+            batches.append(batch)
+        assert [len(batch) for batch in batches] == [2000, 2000]
@@ -34,6 +34,20 @@ class TestEventBus:
         await event_bus.publish_event(event)
         callback.assert_called_once_with(event)
 
+    @pytest.mark.parametrize("sync", [True, False], ids=["sync", "async"])
+    async def test_publish_events(self, sync: bool):
+        event_bus = EventBus()
+        callback = MagicMock() if sync else AsyncMock()
+        event_bus.subscribe_callback(callback)
+        events = [
+            RequestEvent(type="request", request=Request("GET", "https://example.com")),
+            ResponseEvent(type="response", response=Response(200, content=b"")),
+        ]
+        await event_bus.publish_events(events)
+        assert callback.call_count == 2
+        callback.assert_any_call(events[0])
+        callback.assert_any_call(events[1])
+
     async def test_with_multiple_callbacks(self):
         event_bus = EventBus()
         callback1 = MagicMock()
@@ -0,0 +1,22 @@
+from aiosalesforce.http import default_client
+
+
+class TestDefaultClient:
+    async def test_default_limits(self):
+        async with default_client() as client:
+            pool = client._transport._pool
+            assert pool._max_connections == 200
+            assert pool._max_keepalive_connections == 50
+            assert pool._keepalive_expiry == 60.0
+
+    async def test_overrides(self):
+        async with default_client(
+            max_connections=10,
+            max_keepalive_connections=5,
+            http2=False,
+            timeout=1.0,
+        ) as client:
+            pool = client._transport._pool
+            assert pool._max_connections == 10
+            assert pool._max_keepalive_connections == 5
+            assert client.timeout.connect == 1.0